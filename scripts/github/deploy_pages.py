@@ -1,11 +1,51 @@
 #!/usr/bin/env python3
 
+import argparse
+import atexit
+import contextlib
+import errno
+import functools
+import hashlib
+import logging
 import os
-import sys
-import subprocess
+import re
 import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import argparse
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+
+# Commands that do work, as opposed to printing help
+RUN_COMMANDS = ['deploy', 'serve', 'preview', 'build']
+
+# Matches https://github.com/user/repo(.git) and git@github.com:user/repo(.git)
+GITHUB_REMOTE_PATTERN = re.compile(r"github\.com[:/]([^/]+)/(.+?)(?:\.git)?$")
+
+
+# Pushes an already built site_dir to GitHub Pages without building it again,
+# which `mkdocs gh-deploy` itself has no option for.
+# Arguments: config file, site dir, commit message
+GH_DEPLOY_SCRIPT = """
+import sys
+from mkdocs.commands.gh_deploy import gh_deploy
+from mkdocs.config import load_config
+gh_deploy(load_config(config_file=sys.argv[1], site_dir=sys.argv[2]), message=sys.argv[3])
+"""
+
+# ANSI color codes, which mkdocs adds to its log lines when stdout is a TTY
+ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+
+# Chunk size for hashing and for the userspace copy fallback
+IO_BUFFER_SIZE = 1024 * 1024
+
+# copy_file_range/sendfile errors meaning "not supported here" rather than a
+# real I/O failure. EPERM is what Docker's seccomp profile returns for them.
+KERNEL_COPY_UNSUPPORTED_ERRNOS = {
+    errno.EINVAL, errno.ENOSYS, errno.EXDEV, errno.ENOTSOCK, errno.EOPNOTSUPP, errno.EPERM,
+}
 
 
 class Colors:
@@ -14,85 +54,320 @@ class Colors:
     YELLOW = '\033[1;33m'
     NC = '\033[0m'  # No Color
 
+    # Full log prefixes, built once rather than on every log call
+    INFO_PREFIX = f"{GREEN}[INFO]{NC}"
+    WARN_PREFIX = f"{YELLOW}[WARN]{NC}"
+    ERROR_PREFIX = f"{RED}[ERROR]{NC}"
+
+
+# Log lines are queued and written out in one go by flush_log() at phase
+# boundaries, e.g. before handing the terminal to mkdocs or git
+LOG_BUFFER = []
+
+
+def queue_log(line):
+    LOG_BUFFER.append(f"{line}\n")
+
+
+def flush_log():
+    """Write all queued log lines to stdout with a single write"""
+    if LOG_BUFFER:
+        sys.stdout.write("".join(LOG_BUFFER))
+        LOG_BUFFER.clear()
+    sys.stdout.flush()
+
+
+atexit.register(flush_log)
+
 
 def print_status(message):
-    print(f"{Colors.GREEN}[INFO]{Colors.NC} {message}")
+    queue_log(f"{Colors.INFO_PREFIX} {message}")
 
 
 def print_warning(message):
-    print(f"{Colors.YELLOW}[WARN]{Colors.NC} {message}")
+    queue_log(f"{Colors.WARN_PREFIX} {message}")
 
 
 def print_error(message):
-    print(f"{Colors.RED}[ERROR]{Colors.NC} {message}")
+    queue_log(f"{Colors.ERROR_PREFIX} {message}")
 
 
+@functools.lru_cache(maxsize=None)
 def command_exists(command):
     """Check if a command exists in PATH"""
     return shutil.which(command) is not None
 
 
+@functools.lru_cache(maxsize=None)
 def has_uv_project():
     """Check if we have a uv project in the current directory"""
-    script_dir = Path(__file__).parent
-    return (script_dir / "pyproject.toml").exists() and (script_dir / "uv.lock").exists()
+    return (SCRIPT_DIR / "pyproject.toml").exists() and (SCRIPT_DIR / "uv.lock").exists()
+
+
+@functools.lru_cache(maxsize=None)
+def get_project_root():
+    """Get the repository root, relative to this script when run from the uv project"""
+    if has_uv_project():
+        return (SCRIPT_DIR / ".." / "..").resolve()
+    return Path(".").resolve()
+
+
+# The listing is cached, so only look up names this script never creates or
+# modifies (CHANGELOG.md, .github/CONTRIBUTING.md, mkdocs.yml). The project
+# root also gets .mkdocs-cache/ and site/ written to it during a run.
+@functools.lru_cache(maxsize=None)
+def scan_dir(path):
+    """List a directory once per run as a dict of name -> os.DirEntry"""
+    with os.scandir(path) as entries:
+        return {entry.name: entry for entry in entries}
+
+
+@functools.lru_cache(maxsize=None)
+def import_mkdocs():
+    """Import MkDocs for in-process builds, or return None to use the mkdocs CLI"""
+    if has_uv_project():
+        venv_dir = SCRIPT_DIR / os.environ.get("UV_PROJECT_ENVIRONMENT", ".venv")
+        if Path(sys.prefix).resolve() != venv_dir.resolve():
+            return None
+
+    try:
+        import mkdocs.commands.build
+        import mkdocs.commands.gh_deploy
+        import mkdocs.config
+        import mkdocs.exceptions
+    except ImportError:
+        return None
+    return mkdocs
+
+
+def mkdocs_errors():
+    """Exceptions signalling a failed mkdocs command, in-process or not"""
+    mkdocs = import_mkdocs()
+    if mkdocs is None:
+        return (subprocess.CalledProcessError,)
+    return (subprocess.CalledProcessError, mkdocs.exceptions.MkDocsException)
+
+
+@contextlib.contextmanager
+def in_script_dir():
+    """Run the enclosed block from the uv project directory, if there is one"""
+    if not has_uv_project():
+        yield
+        return
+
+    previous_dir = os.getcwd()
+    os.chdir(SCRIPT_DIR)
+    try:
+        yield
+    finally:
+        os.chdir(previous_dir)
+
+
+@functools.lru_cache(maxsize=None)
+def get_uv_python():
+    """Resolve the uv project's interpreter once, so later calls can bypass uv"""
+    try:
+        result = subprocess.run(["uv", "run", "python", "-c", "import sys; print(sys.executable)"],
+                              cwd=SCRIPT_DIR, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def mkdocs_command():
+    """Get the command prefix for running mkdocs, using uv if available"""
+    if not has_uv_project():
+        return ["mkdocs"]
+
+    uv_python = get_uv_python()
+    if uv_python:
+        return [uv_python, "-m", "mkdocs"]
+    return ["uv", "run", "mkdocs"]
+
+
+def uv_python_command():
+    """Get the command prefix for running Python in the uv project, or None without one"""
+    if not has_uv_project():
+        return None
+
+    uv_python = get_uv_python()
+    if uv_python:
+        return [uv_python]
+    return ["uv", "run", "python"]
 
 
 def run_mkdocs(*args):
     """Run mkdocs command, using uv if available"""
-    if has_uv_project():
-        script_dir = Path(__file__).parent
-        os.chdir(script_dir)
-        subprocess.run(["uv", "run", "mkdocs"] + list(args), check=True)
-    else:
-        subprocess.run(["mkdocs"] + list(args), check=True)
+    flush_log()
+    subprocess.run(mkdocs_command() + list(args), check=True)
+
+
+def run_mkdocs_until_error(*args):
+    """Run mkdocs command, echoing its stderr and stopping it at the first error"""
+    flush_log()
+    with subprocess.Popen(mkdocs_command() + list(args),
+                          stderr=subprocess.PIPE, text=True) as process:
+        for line in process.stderr:
+            sys.stderr.write(line)
+            # Only react to mkdocs' own log-level prefix, e.g. "ERROR    -  ..."
+            if ANSI_ESCAPE_PATTERN.sub("", line).startswith("ERROR"):
+                # The build is already doomed, so don't wait for it to finish
+                process.terminate()
+                break
+        returncode = process.wait()
+
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, process.args)
+
+
+def file_sha256(path):
+    """Compute the SHA-256 hex digest of a file, streaming it in 1 MiB chunks"""
+    digest = hashlib.sha256()
+    buffer = bytearray(IO_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb") as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+def fast_copy(source_path, target_path):
+    """Copy a file and its metadata, using kernel-side copies when available"""
+    with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+        in_fd, out_fd = src.fileno(), dst.fileno()
+
+        kernel_copies = []
+        if hasattr(os, "copy_file_range"):
+            kernel_copies.append(lambda: os.copy_file_range(in_fd, out_fd, 2 ** 30))
+        if hasattr(os, "sendfile"):
+            kernel_copies.append(lambda: os.sendfile(out_fd, in_fd, None, 2 ** 30))
+
+        # Some filesystems make copy_file_range return 0 without copying
+        # anything, so only stop once the whole source has been copied
+        source_size = os.fstat(in_fd).st_size
+        copied = 0
+        for kernel_copy in kernel_copies:
+            try:
+                while (sent := kernel_copy()) > 0:
+                    copied += sent
+                if copied >= source_size:
+                    break
+            except OSError as e:
+                if e.errno not in KERNEL_COPY_UNSUPPORTED_ERRNOS:
+                    raise
+        else:
+            shutil.copyfileobj(src, dst, IO_BUFFER_SIZE)
+
+    shutil.copystat(source_path, target_path)
+
+
+def build_in_process(dirty=False, **overrides):
+    """Run the equivalent of `mkdocs build --quiet` in-process"""
+    mkdocs = import_mkdocs()
+    flush_log()
+    logger = logging.getLogger("mkdocs")
+    previous_level = logger.level
+    logger.setLevel(logging.ERROR)
+
+    try:
+        config = mkdocs.config.load_config(
+            config_file=str(get_project_root() / "mkdocs.yml"), **overrides)
+        config.plugins.on_startup(command="build", dirty=dirty)
+        try:
+            mkdocs.commands.build.build(config, dirty=dirty)
+        finally:
+            config.plugins.on_shutdown()
+    finally:
+        logger.setLevel(previous_level)
+
+
+def copy_required_file(source_entry, source_path, target_path):
+    """Copy a single file into the docs directory, returning (print_fn, message)"""
+    # Sidecar file recording the hash of the last copied source
+    hash_path = target_path.with_name(f".{target_path.name}.sha256")
+
+    if source_entry is None:
+        return print_warning, f"Source file not found: {source_path}"
+
+    try:
+        # Cheap make-style check first: copies keep the source mtime via copystat
+        source_stat = source_entry.stat()
+        try:
+            target_stat = target_path.stat()
+            if (source_stat.st_size == target_stat.st_size
+                    and source_stat.st_mtime <= target_stat.st_mtime):
+                return print_status, f"{target_path} is up to date"
+            target_size = target_stat.st_size
+        except FileNotFoundError:
+            target_size = None
+
+        # The sidecar only proves the source is unchanged since the last copy,
+        # so also require the target to still be the same size as the source
+        source_hash = file_sha256(source_path)
+        if (target_size == source_stat.st_size and hash_path.exists()
+                and hash_path.read_text().strip() == source_hash):
+            # Same content with an older mtime (e.g. after a checkout), so sync
+            # the metadata to let the stat check above short-circuit next time
+            shutil.copystat(source_path, target_path)
+            return print_status, f"{target_path} is up to date"
+
+        fast_copy(source_path, target_path)
+        hash_path.write_text(source_hash)
+        return print_status, f"Copied {source_path} to {target_path}"
+    except Exception as e:
+        return print_warning, f"Failed to copy {source_path}: {e}"
 
 
 def copy_required_files():
     """Copy required files to docs directory"""
     print_status("Copying required files to docs directory...")
 
-    # Determine project root directory
-    if has_uv_project():
-        script_dir = Path(__file__).parent
-        project_root = script_dir / ".." / ".."
+    project_root = get_project_root()
+    root_entries = scan_dir(project_root)
+    if ".github" in root_entries:
+        github_entries = scan_dir(project_root / ".github")
     else:
-        project_root = Path(".")
+        github_entries = {}
 
     docs_dir = project_root / "docs"
 
-    # Files to copy: (source_path, target_filename)
+    # Files to copy: (source_entry, source_path, target_path)
     files_to_copy = [
-        (project_root / "CHANGELOG.md", "changelog.md"),
-        (project_root / ".github" / "CONTRIBUTING.md", "contributing/index.md")
+        (root_entries.get("CHANGELOG.md"),
+         project_root / "CHANGELOG.md", docs_dir / "changelog.md"),
+        (github_entries.get("CONTRIBUTING.md"),
+         project_root / ".github" / "CONTRIBUTING.md", docs_dir / "contributing" / "index.md")
     ]
 
-    for source_path, target_filename in files_to_copy:
-        target_path = docs_dir / target_filename
+    # Copy concurrently, then report in a stable order
+    with ThreadPoolExecutor(max_workers=len(files_to_copy)) as executor:
+        results = list(executor.map(lambda job: copy_required_file(*job), files_to_copy))
+
+    for print_fn, message in results:
+        print_fn(message)
+    flush_log()
 
-        if source_path.exists():
-            try:
-                shutil.copy2(source_path, target_path)
-                print_status(f"Copied {source_path} to {target_path}")
-            except Exception as e:
-                print_warning(f"Failed to copy {source_path}: {e}")
-        else:
-            print_warning(f"Source file not found: {source_path}")
+
+def get_cache_dir():
+    """Return the persistent MkDocs cache directory, creating it if needed"""
+    cache_dir = get_project_root() / ".mkdocs-cache"
+    cache_dir.mkdir(exist_ok=True)
+    return cache_dir
 
 
 def check_git_status():
     """Check git status and warn about uncommitted changes"""
     try:
-        if has_uv_project():
-            script_dir = Path(__file__).parent
-            git_dir = script_dir / ".." / ".."
-            os.chdir(git_dir)
-
-        result = subprocess.run(["git", "status", "--porcelain"],
-                              capture_output=True, text=True, check=True)
+        # Only emptiness matters, so keep the raw NUL-separated bytes undecoded
+        result = subprocess.run(["git", "status", "--porcelain=v1", "-z"],
+                              capture_output=True, check=True)
 
-        if result.stdout.strip():
+        if result.stdout:
             print_warning("You have uncommitted changes. It's recommended to commit them before deploying docs.")
+            flush_log()
             response = input("Do you want to continue anyway? (y/N): ")
             if response.lower() != 'y':
                 print_status("Deployment cancelled.")
@@ -101,37 +376,45 @@ def check_git_status():
         print_warning("Could not check git status")
 
 
-def validate_mkdocs_config():
-    """Validate MkDocs configuration"""
+def validate_mkdocs_config(site_dir=None, dirty=False):
+    """Validate MkDocs configuration, keeping the build in site_dir if given"""
     print_status("Validating MkDocs configuration...")
 
+    config_file = get_project_root() / "mkdocs.yml"
     if has_uv_project():
-        script_dir = Path(__file__).parent
-        config_file = script_dir / ".." / ".." / "mkdocs.yml"
         config_file_arg = "../../mkdocs.yml"
     else:
-        config_file = Path("mkdocs.yml")
         config_file_arg = "mkdocs.yml"
 
-    if not config_file.exists():
+    if "mkdocs.yml" not in scan_dir(get_project_root()):
         print_error(f"mkdocs.yml not found at {config_file}")
         sys.exit(1)
 
+    if site_dir is not None:
+        site_dir_context = contextlib.nullcontext(str(site_dir))
+        overrides = {}
+        extra_args = ["--dirty"] if dirty else []
+    else:
+        tmp_root = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        site_dir_context = tempfile.TemporaryDirectory(prefix="mkdocs-validate-", dir=tmp_root)
+        # The output is discarded, so skip creating a directory per page
+        overrides = {"use_directory_urls": False}
+        extra_args = ["--no-directory-urls"]
+
     # Check if MkDocs can build successfully
-    try:
-        if has_uv_project():
-            script_dir = Path(__file__).parent
-            os.chdir(script_dir)
-            subprocess.run(["uv", "run", "mkdocs", "build", "--strict", "--quiet",
-                          "--config-file", config_file_arg], check=True)
-        else:
-            subprocess.run(["mkdocs", "build", "--strict", "--quiet",
-                          "--config-file", config_file_arg], check=True)
+    with site_dir_context as build_dir:
+        try:
+            if import_mkdocs() is not None:
+                build_in_process(dirty=dirty, strict=True, site_dir=build_dir, **overrides)
+            else:
+                run_mkdocs_until_error("build", "--strict", "--quiet",
+                                       "--site-dir", build_dir, *extra_args,
+                                       "--config-file", config_file_arg)
 
-        print_status("MkDocs configuration is valid")
-    except subprocess.CalledProcessError:
-        print_error("MkDocs build failed. Please fix configuration errors.")
-        sys.exit(1)
+            print_status("MkDocs configuration is valid")
+        except mkdocs_errors():
+            print_error("MkDocs build failed. Please fix configuration errors.")
+            sys.exit(1)
 
 
 def deploy_docs():
@@ -141,16 +424,39 @@ def deploy_docs():
     # Copy required files first
     copy_required_files()
 
+    # Keep the validation build so it can be deployed as-is
+    site_dir = get_cache_dir() / "site"
+    validate_mkdocs_config(site_dir)
+
     # Deploy to gh-pages branch
     if has_uv_project():
         config_file_arg = "../../mkdocs.yml"
     else:
         config_file_arg = "mkdocs.yml"
 
+    # The validation build above is a clean build of the current sources, so
+    # push it as-is instead of letting gh-deploy build the site again
+    message = "Deploy documentation for commit {sha}"
+    config_file = str(get_project_root() / "mkdocs.yml")
+    print_status(f"Deploying validated build from {site_dir}")
+
+    mkdocs = import_mkdocs()
+    python_command = uv_python_command()
+    flush_log()
     try:
-        run_mkdocs("gh-deploy", "--clean",
-                  "--message", "Deploy documentation for commit {sha}",
-                  "--config-file", config_file_arg)
+        if mkdocs is not None:
+            config = mkdocs.config.load_config(config_file=config_file, site_dir=str(site_dir))
+            mkdocs.commands.gh_deploy.gh_deploy(config, message=message)
+        elif python_command is not None:
+            subprocess.run(python_command + ["-c", GH_DEPLOY_SCRIPT,
+                                             config_file, str(site_dir), message], check=True)
+        else:
+            # Only the mkdocs CLI is available, which always builds first
+            print_status("mkdocs will warn about a 'dirty' build: only pages changed "
+                         "since validation are re-rendered, and none have changed")
+            run_mkdocs("gh-deploy", "--dirty", "--site-dir", str(site_dir),
+                      "--message", message,
+                      "--config-file", config_file_arg)
 
         print_status("Documentation deployed successfully!")
         print_status("Your documentation will be available at:")
@@ -161,29 +467,22 @@ def deploy_docs():
                                   capture_output=True, text=True, check=True)
             repo_url = result.stdout.strip()
 
-            if "github.com" in repo_url:
-                # Extract username/repo from URL
-                if repo_url.endswith(".git"):
-                    repo_path = repo_url[:-4]  # Remove .git
-                else:
-                    repo_path = repo_url
-
-                if "github.com/" in repo_path:
-                    user_repo = repo_path.split("github.com/")[1]
-                    user_repo = user_repo.replace(":", "/")  # Replace : with / for SSH URLs
-                    user, repo = user_repo.split("/", 1)
-                    print(f"  https://{user}.github.io/{repo}/")
+            # Extract username/repo from HTTPS or SSH URL
+            match = GITHUB_REMOTE_PATTERN.search(repo_url)
+            if match:
+                user, repo = match.groups()
+                queue_log(f"  https://{user}.github.io/{repo}/")
         except subprocess.CalledProcessError:
             pass
 
         print_status("Note: It may take a few minutes for changes to appear on GitHub Pages.")
 
-    except subprocess.CalledProcessError:
+    except mkdocs_errors():
         print_error("Deployment failed!")
         sys.exit(1)
 
 
-def serve_docs():
+def serve_docs(cached=False):
     """Serve docs locally for testing"""
     print_status("Starting local documentation server...")
     print_status("Documentation will be available at: http://127.0.0.1:8000")
@@ -194,18 +493,32 @@ def serve_docs():
     else:
         config_file_arg = "mkdocs.yml"
 
+    serve_args = ["serve", "--config-file", config_file_arg]
+    if cached:
+        # Only rebuild pages that changed since the last reload
+        serve_args.append("--dirty")
+
     try:
-        run_mkdocs("serve", "--config-file", config_file_arg)
+        run_mkdocs(*serve_args)
     except KeyboardInterrupt:
         print_status("Server stopped.")
 
 
-def build_docs():
+def build_docs(cached=False):
     """Build documentation locally"""
 
     # Copy required files first
     copy_required_files()
 
+    if cached:
+        # The strict validation build goes straight into the cache and only
+        # re-renders pages that changed, so no second build is needed. This
+        # also means only those changed pages are validated.
+        site_dir = get_cache_dir() / "site"
+        validate_mkdocs_config(site_dir, dirty=True)
+        print_status(f"Documentation built in {site_dir} directory")
+        return
+
     validate_mkdocs_config()
 
     if has_uv_project():
@@ -221,8 +534,8 @@ def build_docs():
         sys.exit(1)
 
 
-def main():
-    """Main script logic"""
+def build_arg_parser():
+    """Build the command line parser, including the full help text"""
     parser = argparse.ArgumentParser(
         description="AutoMobile Documentation Deployment",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -244,16 +557,37 @@ Automatic Deployment:
         """)
 
     parser.add_argument('command', nargs='?', default='deploy',
-                       choices=['deploy', 'serve', 'preview', 'build', 'help'],
+                       choices=RUN_COMMANDS + ['help'],
                        help='Command to run (default: deploy)')
+    parser.add_argument('--cached', action='store_true',
+                       help='build: render into .mkdocs-cache/site, re-rendering and '
+                            'strictly validating only pages changed since the last '
+                            'cached build; serve/preview: only rebuild changed pages '
+                            'on reload')
+    return parser
+
 
-    args = parser.parse_args()
+def parse_args(argv):
+    """Parse command line arguments, skipping argparse for plain command invocations"""
+    positional = [arg for arg in argv if arg != '--cached']
+    if len(positional) <= 1 and all(arg in RUN_COMMANDS for arg in positional):
+        return argparse.Namespace(command=positional[0] if positional else 'deploy',
+                                  cached='--cached' in argv)
+
+    # help, -h/--help and anything unrecognized go through argparse
+    return build_arg_parser().parse_args(argv)
+
+
+def main():
+    """Main script logic"""
+    args = parse_args(sys.argv[1:])
 
     print_status("AutoMobile Documentation Deployment")
     print_status("========================================")
 
     if args.command == 'help':
-        parser.print_help()
+        flush_log()
+        build_arg_parser().print_help()
         return
 
     # Check if MkDocs is available
@@ -262,18 +596,18 @@ Automatic Deployment:
         print_error("Please run 'uv sync' in the scripts/github directory first.")
         sys.exit(1)
 
-    if args.command == 'deploy':
-        print_status("Deploying documentation to GitHub Pages...")
-        check_git_status()
-        validate_mkdocs_config()
-        deploy_docs()
+    with in_script_dir():
+        if args.command == 'deploy':
+            print_status("Deploying documentation to GitHub Pages...")
+            check_git_status()
+            deploy_docs()
 
-    elif args.command in ['serve', 'preview']:
-        print_status("Starting local documentation server for preview...")
-        serve_docs()
+        elif args.command in ['serve', 'preview']:
+            print_status("Starting local documentation server for preview...")
+            serve_docs(cached=args.cached)
 
-    elif args.command == 'build':
-        build_docs()
+        elif args.command == 'build':
+            build_docs(cached=args.cached)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import deploy_pages
+
+
+class RunMkdocsUntilErrorTest(unittest.TestCase):
+
+    def run_child(self, stderr_line):
+        # Child that reports a line on stderr, then keeps "building"
+        child = [sys.executable, "-c",
+                 f"import sys, time; sys.stderr.write({stderr_line!r}); "
+                 "sys.stderr.flush(); time.sleep(30)"]
+        with mock.patch.object(deploy_pages, "mkdocs_command", return_value=child), \
+                mock.patch.object(sys, "stderr"):
+            started = time.monotonic()
+            with self.assertRaises(subprocess.CalledProcessError):
+                deploy_pages.run_mkdocs_until_error()
+            return time.monotonic() - started
+
+    def test_stops_at_plain_error_line(self):
+        self.assertLess(self.run_child("ERROR   -  Config value 'theme'\n"), 10)
+
+    def test_stops_at_colored_error_line(self):
+        self.assertLess(self.run_child("\x1b[31mERROR   -  \x1b[0mConfig value 'theme'\n"), 10)
+
+
+class FastCopyTest(unittest.TestCase):
+
+    def test_falls_back_when_copy_file_range_copies_nothing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "CHANGELOG.md")
+            target = os.path.join(tmp, "changelog.md")
+            with open(source, "wb") as f:
+                f.write(b"# Changelog\n" * 1000)
+
+            with mock.patch.object(os, "copy_file_range", return_value=0, create=True):
+                deploy_pages.fast_copy(source, target)
+
+            with open(source, "rb") as src, open(target, "rb") as dst:
+                self.assertEqual(src.read(), dst.read())
+
+
+if __name__ == "__main__":
+    unittest.main()